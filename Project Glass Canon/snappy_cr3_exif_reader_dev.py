@@ -1,6 +1,7 @@
 import struct
 import os
-import binascii
+import mmap
+import concurrent.futures
 from datetime import datetime
 from pathlib import Path
 import tkinter as tk
@@ -8,6 +9,22 @@ from tkinter import filedialog
 
 # --- CONSTANTS ---
 CANON_CMT1_UUID = "85c0b687820f11e08111f4ce462b6a48"
+CANON_CMT1_UUID_BYTES = bytes.fromhex(CANON_CMT1_UUID)
+
+# Precompiled struct formats for the hot parsing paths (avoids re-parsing
+# the format string on every unpack call)
+_IFD_ENTRY12 = struct.Struct('<HHI4s')  # full 12-byte entry incl. inline value
+_U16LE = struct.Struct('<H')
+_U32LE = struct.Struct('<I')
+_RAT = struct.Struct('<II')
+_SRAT = struct.Struct('<ii')
+_BOX = struct.Struct('>I4s')
+_BOX64 = struct.Struct('>Q')
+
+# ISO-BMFF boxes we descend into (header only); everything else - most
+# importantly the huge mdat pixel box - is skipped by its declared size,
+# so the walk touches O(box_count) headers regardless of file size
+CONTAINER_BOXES = frozenset({b'moov', b'trak', b'mdia', b'minf', b'stbl', b'udta'})
 
 # Enable debug mode to see all raw tags
 DEBUG_MODE = False
@@ -122,6 +139,23 @@ TIFF_TAGS = {
     330: "SubIFDs",
 }
 
+# Tag IDs worth decoding: whitelisted output fields plus the IFD pointers
+# we follow. Everything else is skipped before its value is ever decoded,
+# since write_sidecar would discard it anyway.
+WANTED_TAG_IDS = (
+    {tag_id for tag_id, name in TIFF_TAGS.items() if name in OUTPUT_FIELDS}
+    | {tag_id for tag_id, name in TIFF5_CANON_TAGS.items() if name in OUTPUT_FIELDS}
+    | {34665, 330}
+)
+
+# Flat list mirror of TIFF_TAGS for zero-hash name lookups by tag id
+# (max tag id is ~42k, so this is a one-time ~330KB of references)
+_MAX_TAG_ID = max(TIFF_TAGS) + 1
+_TIFF_TAGS_LIST = [None] * _MAX_TAG_ID
+for _tag_id, _tag_name in TIFF_TAGS.items():
+    _TIFF_TAGS_LIST[_tag_id] = _tag_name
+del _tag_id, _tag_name
+
 def clean_user_input(user_input):
     """
     Cleans user input by removing quotes, improper slashes, and extra spaces.
@@ -146,80 +180,131 @@ def is_cr3_file(file_path):
     CR3 files start with ftyp box containing 'crx' brand.
     """
     try:
-        with open(file_path, 'rb') as f:
-            # Read first 20 bytes
-            header = f.read(20)
-            if len(header) < 20:
-                return False
-
-            # Check for ftyp box and crx brand
-            box_size = struct.unpack('>I', header[0:4])[0]
-            box_type = header[4:8].decode('utf-8', errors='ignore')
-            brand = header[8:12].decode('utf-8', errors='ignore')
-
-            return box_type == 'ftyp' and 'crx' in brand
+        # One pread of the first 12 bytes - no buffered file object needed
+        # just to reject non-CR3 files during batch runs
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            header = os.pread(fd, 12, 0)
+        finally:
+            os.close(fd)
+
+        # Check for ftyp box and crx brand, compared as raw bytes
+        return len(header) >= 12 and header[4:8] == b'ftyp' and b'crx' in header[8:12]
     except Exception:
         return False
 
-def format_tag_value(tag_type, count, value_data, file_handle, data_offset):
+def format_tag_value(tag_type, count, value_data, buf, data_offset):
     """
     Formats TIFF tag values based on their type.
     Types: 1=BYTE, 2=ASCII, 3=SHORT, 4=LONG, 5=RATIONAL, 7=UNDEFINED, 9=SLONG, 10=SRATIONAL
+    buf is a random-access buffer (mmap or bytes); data_offset is the TIFF base.
     """
     try:
         if tag_type == 2:  # ASCII
             if count <= 4:
-                return value_data.split(b'\x00')[0].decode('utf-8', errors='ignore')
+                raw = value_data
             else:
-                current_pos = file_handle.tell()
-                offset = struct.unpack('<I', value_data)[0]
-                file_handle.seek(data_offset + offset)
-                string = file_handle.read(count).split(b'\x00')[0].decode('utf-8', errors='ignore')
-                file_handle.seek(current_pos)
-                return string
+                offset = _U32LE.unpack_from(value_data)[0]
+                raw = buf[data_offset + offset:data_offset + offset + count]
+            # Trim at the NUL terminator without allocating a split list
+            nul = raw.find(b'\x00')
+            if nul >= 0:
+                raw = raw[:nul]
+            return raw.decode('utf-8', errors='ignore')
 
         elif tag_type == 3:  # SHORT
             if count == 1:
-                return struct.unpack('<H', value_data[0:2])[0]
+                return _U16LE.unpack_from(value_data)[0]
             else:
-                current_pos = file_handle.tell()
-                offset = struct.unpack('<I', value_data)[0]
-                file_handle.seek(data_offset + offset)
-                values = [struct.unpack('<H', file_handle.read(2))[0] for _ in range(count)]
-                file_handle.seek(current_pos)
+                offset = _U32LE.unpack_from(value_data)[0]
+                values = [_U16LE.unpack_from(buf, data_offset + offset + 2 * i)[0]
+                          for i in range(count)]
                 return values if len(values) > 1 else values[0]
 
         elif tag_type == 4:  # LONG
-            return struct.unpack('<I', value_data)[0]
+            return _U32LE.unpack_from(value_data)[0]
 
         elif tag_type == 5:  # RATIONAL
-            current_pos = file_handle.tell()
-            offset = struct.unpack('<I', value_data)[0]
-            file_handle.seek(data_offset + offset)
-            numerator = struct.unpack('<I', file_handle.read(4))[0]
-            denominator = struct.unpack('<I', file_handle.read(4))[0]
-            file_handle.seek(current_pos)
+            offset = _U32LE.unpack_from(value_data)[0]
+            numerator, denominator = _RAT.unpack_from(buf, data_offset + offset)
             if denominator == 0:
                 return 0
             return numerator / denominator
 
         elif tag_type == 10:  # SRATIONAL (signed)
-            current_pos = file_handle.tell()
-            offset = struct.unpack('<I', value_data)[0]
-            file_handle.seek(data_offset + offset)
-            numerator = struct.unpack('<i', file_handle.read(4))[0]
-            denominator = struct.unpack('<i', file_handle.read(4))[0]
-            file_handle.seek(current_pos)
+            offset = _U32LE.unpack_from(value_data)[0]
+            numerator, denominator = _SRAT.unpack_from(buf, data_offset + offset)
             if denominator == 0:
                 return 0
             return numerator / denominator
 
         else:
-            return struct.unpack('<I', value_data)[0]
+            return _U32LE.unpack_from(value_data)[0]
 
     except Exception as e:
         return f"<parse error: {e}>"
 
+def _parse_ifd(buf, tiff_base, ifd_offset, metadata, prefix, tag_map, unknown_label="Tag", depth=0):
+    """
+    Parses one IFD's entries into metadata, recursing into the EXIF IFD
+    (tag 34665) and SubIFD (tag 330) pointers. buf is a random-access
+    buffer (mmap or bytes); prefix is prepended to every metadata key.
+    """
+    if depth > 3:  # Sanity check against self-referencing IFD chains
+        return
+
+    num_entries, = _U16LE.unpack_from(buf, tiff_base + ifd_offset)
+
+    # Skip IFDs with suspiciously high entry counts (likely corrupt)
+    if num_entries > 200:
+        if __debug__ and DEBUG_MODE:
+            print(f"[DEBUG] Skipping - too many entries: {num_entries}")
+        return
+
+    if __debug__ and DEBUG_MODE:
+        print(f"[DEBUG] IFD at offset {ifd_offset} has {num_entries} entries")
+
+    # Bulk-decode the whole entry block in one slice + iter_unpack pass
+    entries_start = tiff_base + ifd_offset + 2
+    block = buf[entries_start:entries_start + 12 * num_entries]
+    block = block[:12 * (len(block) // 12)]
+
+    for tag_id, tag_type, count, value_data in _IFD_ENTRY12.iter_unpack(block):
+        if __debug__ and DEBUG_MODE:
+            print(f"[DEBUG]   Tag {tag_id}: Type={tag_type}, Count={count}")
+
+        # Skip tags the sidecar will never show - no point decoding them
+        if tag_id not in WANTED_TAG_IDS:
+            continue
+
+        # Follow the EXIF IFD pointer
+        if tag_id == 34665:
+            exif_offset = _U32LE.unpack_from(value_data)[0]
+            if __debug__ and DEBUG_MODE:
+                print(f"[DEBUG]   Following EXIF IFD pointer to offset {exif_offset}")
+            _parse_ifd(buf, tiff_base, exif_offset, metadata, prefix,
+                       tag_map, "ExifTag", depth + 1)
+
+        # Follow the SubIFDs pointer
+        elif tag_id == 330:
+            sub_ifd_offset = _U32LE.unpack_from(value_data)[0]
+            if __debug__ and DEBUG_MODE:
+                print(f"[DEBUG]   Following SubIFD pointer to offset {sub_ifd_offset}")
+            _parse_ifd(buf, tiff_base, sub_ifd_offset, metadata, prefix + "SubIFD_",
+                       tag_map, "SubTag", depth + 1)
+
+        else:
+            # Standard tag table goes through the flat list (no dict
+            # hashing); only the TIFF5 Canon merge needs the dict path
+            if tag_map is TIFF_TAGS:
+                tag_name = _TIFF_TAGS_LIST[tag_id] if tag_id < _MAX_TAG_ID else None
+                if tag_name is None:
+                    tag_name = f"Unknown{unknown_label}_{tag_id}"
+            else:
+                tag_name = tag_map.get(tag_id, f"Unknown{unknown_label}_{tag_id}")
+            value = format_tag_value(tag_type, count, value_data, buf, tiff_base)
+            metadata[f"{prefix}{tag_name}"] = value
+
 def extract_metadata(file_path):
     """
     Extracts metadata from a CR3 file.
@@ -229,175 +314,105 @@ def extract_metadata(file_path):
 
     try:
         with open(file_path, 'rb') as f:
-            file_size = os.path.getsize(file_path)
-
-            while f.tell() < file_size:
-                current_pos = f.tell()
-                header = f.read(8)
-                if len(header) < 8:
+            # Map the whole file read-only: every field access becomes index
+            # arithmetic against the page cache instead of seek/read syscalls
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            file_size = len(mm)
+
+            # Tell the kernel the box walk reads forward so it can read
+            # ahead aggressively (madvise is not available on Windows)
+            can_advise = hasattr(mm, 'madvise')
+            if can_advise:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            pos = 0
+            while pos < file_size:
+                if pos + 8 > file_size:
                     break
 
-                box_size, = struct.unpack('>I', header[0:4])
-                box_type = header[4:8].decode('utf-8', errors='ignore')
+                # Box type stays raw bytes - no per-box UTF-8 decode
+                box_size, box_type = _BOX.unpack_from(mm, pos)
 
                 header_len = 8
                 if box_size == 1:
-                    box_size, = struct.unpack('>Q', f.read(8))
+                    if pos + 16 > file_size:
+                        break
+                    box_size, = _BOX64.unpack_from(mm, pos + 8)
                     header_len = 16
 
                 if box_size == 0 or box_size > file_size:
                     break
 
-                if box_type == 'uuid':
-                    uuid_hex = binascii.hexlify(f.read(16)).decode('utf-8')
-                    if DEBUG_MODE:
-                        print(f"[DEBUG] Found UUID box: {uuid_hex}")
-                    if uuid_hex == CANON_CMT1_UUID:
-                        # Found Canon UUID, search for ALL TIFF headers
-                        search_start = current_pos + header_len + 16
-                        f.seek(search_start)
-                        chunk = f.read(200000)  # Search 200KB instead of 50KB
-
-                        # Find all TIFF headers
+                if box_type == b'uuid':
+                    uuid_bytes = mm[pos + header_len:pos + header_len + 16]
+                    if __debug__ and DEBUG_MODE:
+                        print(f"[DEBUG] Found UUID box: {uuid_bytes.hex()}")
+                    if uuid_bytes == CANON_CMT1_UUID_BYTES:
+                        # Found Canon UUID, search for ALL TIFF headers.
+                        # Run the scan directly on the mmap (no 200KB copy)
+                        search_start = pos + header_len + 16
+                        search_end = search_start + 200000  # Search 200KB instead of 50KB
+
+                        if can_advise:
+                            # Force-page the TIFF search window before scanning
+                            # (madvise offsets must be page-aligned)
+                            page_start = search_start - (search_start % mmap.PAGESIZE)
+                            mm.madvise(mmap.MADV_WILLNEED, page_start,
+                                       min(file_size, search_end) - page_start)
+
                         tiff_indices = []
-                        search_pos = 0
-                        while True:
-                            tiff_idx = chunk.find(b'\x49\x49\x2A\x00', search_pos)
-                            if tiff_idx == -1:
-                                break
-                            tiff_indices.append(tiff_idx)
-                            search_pos = tiff_idx + 1
-
-                        if DEBUG_MODE:
+                        find = mm.find
+                        search_pos = search_start
+                        while (hit := find(b'\x49\x49\x2A\x00', search_pos, search_end)) != -1:
+                            tiff_indices.append(hit - search_start)
+                            search_pos = hit + 1
+
+                        if __debug__ and DEBUG_MODE:
                             print(f"[DEBUG] Found {len(tiff_indices)} TIFF header(s) in Canon UUID")
 
                         # Process each TIFF structure
                         for tiff_num, tiff_idx in enumerate(tiff_indices):
-                            if DEBUG_MODE:
+                            if __debug__ and DEBUG_MODE:
                                 print(f"\n[DEBUG] === Processing TIFF #{tiff_num + 1} at offset +{tiff_idx} ===")
 
                             tiff_base = search_start + tiff_idx
 
                             try:
                                 # Parse IFD0
-                                f.seek(tiff_base + 4)
-                                ifd_offset, = struct.unpack('<I', f.read(4))
+                                ifd_offset, = _U32LE.unpack_from(mm, tiff_base + 4)
 
                                 # Skip invalid IFD offsets
                                 if ifd_offset > 50000 or ifd_offset < 8:
-                                    if DEBUG_MODE:
+                                    if __debug__ and DEBUG_MODE:
                                         print(f"[DEBUG] Skipping - invalid IFD offset: {ifd_offset}")
                                     continue
 
-                                f.seek(tiff_base + ifd_offset)
-                                num_entries, = struct.unpack('<H', f.read(2))
-
-                                # Skip TIFFs with suspiciously high entry counts (likely corrupt)
-                                if num_entries > 200:
-                                    if DEBUG_MODE:
-                                        print(f"[DEBUG] Skipping - too many entries: {num_entries}")
-                                    continue
-
-                                if DEBUG_MODE:
-                                    print(f"[DEBUG] IFD0 has {num_entries} entries")
-
-                                # Parse main IFD tags
-                                for i in range(num_entries):
-                                    entry = f.read(12)
-                                    if len(entry) < 12:
-                                        break
+                                # Use TIFF5 Canon tags for TIFF5, otherwise standard TIFF tags
+                                if tiff_num == 4:  # TIFF5 (0-indexed, so tiff_num 4 = TIFF5)
+                                    tag_map = {**TIFF_TAGS, **TIFF5_CANON_TAGS}
+                                else:
+                                    tag_map = TIFF_TAGS
+                                prefix = f"TIFF{tiff_num+1}_" if tiff_num > 0 else ""
 
-                                    tag_id, tag_type, count = struct.unpack('<HHI', entry[0:8])
-                                    value_data = entry[8:12]
-
-                                    # Use TIFF5 Canon tags for TIFF5, otherwise standard TIFF tags
-                                    if tiff_num == 4:  # TIFF5 (0-indexed, so tiff_num 4 = TIFF5)
-                                        tag_name = TIFF5_CANON_TAGS.get(tag_id, TIFF_TAGS.get(tag_id, f"UnknownTag_{tag_id}"))
-                                    else:
-                                        tag_name = TIFF_TAGS.get(tag_id, f"UnknownTag_{tag_id}")
-                                    prefix = f"TIFF{tiff_num+1}_" if tiff_num > 0 else ""
-
-                                    if DEBUG_MODE:
-                                        print(f"[DEBUG]   Tag {tag_id} ({tag_name}): Type={tag_type}, Count={count}")
-
-                                    # Special handling for ExifIFDPointer
-                                    if tag_id == 34665:
-                                        exif_offset = struct.unpack('<I', value_data)[0]
-                                        if DEBUG_MODE:
-                                            print(f"[DEBUG]   Following EXIF IFD pointer to offset {exif_offset}")
-                                        # Parse EXIF IFD
-                                        current_ifd_pos = f.tell()
-                                        f.seek(tiff_base + exif_offset)
-                                        exif_entries, = struct.unpack('<H', f.read(2))
-
-                                        if DEBUG_MODE:
-                                            print(f"[DEBUG]   EXIF IFD has {exif_entries} entries")
-
-                                        for j in range(exif_entries):
-                                            exif_entry = f.read(12)
-                                            if len(exif_entry) < 12:
-                                                break
-
-                                            exif_tag_id, exif_tag_type, exif_count = struct.unpack('<HHI', exif_entry[0:8])
-                                            exif_value_data = exif_entry[8:12]
-
-                                            exif_tag_name = TIFF_TAGS.get(exif_tag_id, f"UnknownExifTag_{exif_tag_id}")
-
-                                            if DEBUG_MODE:
-                                                print(f"[DEBUG]     EXIF Tag {exif_tag_id} ({exif_tag_name}): Type={exif_tag_type}, Count={exif_count}")
-
-                                            exif_value = format_tag_value(exif_tag_type, exif_count, exif_value_data, f, tiff_base)
-                                            metadata[f"{prefix}{exif_tag_name}"] = exif_value
-
-                                        f.seek(current_ifd_pos)
-
-                                    # Handle SubIFDs pointer
-                                    elif tag_id == 330:
-                                        sub_ifd_offset = struct.unpack('<I', value_data)[0]
-                                        if DEBUG_MODE:
-                                            print(f"[DEBUG]   Following SubIFD pointer to offset {sub_ifd_offset}")
-                                        current_ifd_pos = f.tell()
-                                        f.seek(tiff_base + sub_ifd_offset)
-                                        sub_entries, = struct.unpack('<H', f.read(2))
-
-                                        if DEBUG_MODE:
-                                            print(f"[DEBUG]   SubIFD has {sub_entries} entries")
-
-                                        for k in range(sub_entries):
-                                            sub_entry = f.read(12)
-                                            if len(sub_entry) < 12:
-                                                break
-
-                                            sub_tag_id, sub_tag_type, sub_count = struct.unpack('<HHI', sub_entry[0:8])
-                                            sub_value_data = sub_entry[8:12]
-
-                                            sub_tag_name = TIFF_TAGS.get(sub_tag_id, f"UnknownSubTag_{sub_tag_id}")
-
-                                            if DEBUG_MODE:
-                                                print(f"[DEBUG]     SubIFD Tag {sub_tag_id} ({sub_tag_name}): Type={sub_tag_type}, Count={sub_count}")
-
-                                            sub_value = format_tag_value(sub_tag_type, sub_count, sub_value_data, f, tiff_base)
-                                            metadata[f"{prefix}SubIFD_{sub_tag_name}"] = sub_value
-
-                                        f.seek(current_ifd_pos)
-
-                                    else:
-                                        value = format_tag_value(tag_type, count, value_data, f, tiff_base)
-                                        metadata[f"{prefix}{tag_name}"] = value
+                                _parse_ifd(mm, tiff_base, ifd_offset, metadata, prefix, tag_map)
 
                             except Exception as e:
-                                if DEBUG_MODE:
+                                if __debug__ and DEBUG_MODE:
                                     print(f"[DEBUG] Error parsing TIFF #{tiff_num + 1}: {e}")
                                 continue
 
                         if metadata:
+                            mm.close()
                             return metadata
 
-                # Navigate boxes
-                if box_type in ['moov', 'trak', 'mdia', 'minf', 'stbl']:
-                    f.seek(current_pos + header_len)
+                # Navigate boxes: descend into containers, hop over leaves
+                # (mdat in particular) without ever touching their payload
+                if box_type in CONTAINER_BOXES:
+                    pos += header_len
                 else:
-                    f.seek(current_pos + box_size)
+                    pos += box_size
+
+            mm.close()
 
     except Exception as e:
         print(f"Error extracting metadata: {e}")
@@ -405,112 +420,125 @@ def extract_metadata(file_path):
 
     return None
 
-def write_sidecar(cr3_path, metadata):
+def write_sidecar(cr3_path, sidecar_path, metadata):
     """
-    Writes metadata to a sidecar text file next to the CR3 file.
+    Writes metadata to the given sidecar text file next to the CR3 file.
     """
-    # Generate sidecar filename
     cr3_file = Path(cr3_path)
-    sidecar_path = cr3_file.parent / f"{cr3_file.stem}_metadata.txt"
 
     try:
-        with open(sidecar_path, 'w', encoding='utf-8') as f:
-            f.write("="*60 + "\n")
-            f.write(f"CR3 METADATA EXTRACTION\n")
-            f.write(f"Source File: {cr3_file.name}\n")
-            f.write(f"Extracted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("="*60 + "\n\n")
-
-            # Helper function to find field in metadata (check with and without TIFF prefix)
-            def find_field(field_name):
-                # Check exact match first
-                if field_name in metadata:
-                    return field_name, metadata[field_name]
-                # Check for TIFF-prefixed versions (prefer higher TIFF numbers as they're more accurate)
-                for tiff_num in range(10, 0, -1):
-                    prefixed = f"TIFF{tiff_num}_{field_name}"
-                    if prefixed in metadata:
-                        return prefixed, metadata[prefixed]
-                return None, None
-
-            # Write metadata in organized sections
-            camera_lens_fields = ['Make', 'Model', 'LensModel', 'LensSpecification']
-            exposure_fields = ['ExposureTime', 'FNumber', 'ISOSpeedRatings', 'ShutterSpeedValue',
-                             'ApertureValue', 'ExposureBiasValue', 'FocalLength', 'FocalLengthIn35mmFilm',
-                             'ExposureProgram', 'ExposureMode', 'MeteringMode', 'WhiteBalance', 'Flash']
-            datetime_fields = ['DateTime', 'DateTimeOriginal', 'DateTimeDigitized']
-            image_fields = ['ImageWidth', 'ImageLength', 'Orientation', 'Artist', 'Copyright']
-            serial_fields = ['LensSerialNumber', 'LensManufacturingCode', 'FirmwareVersion']
-
-            used_keys = set()
-
-            # Camera & Lens info
-            f.write("CAMERA & LENS:\n")
-            f.write("-" * 60 + "\n")
-            for field in camera_lens_fields:
-                key, value = find_field(field)
-                if key:
-                    f.write(f"{field:30s}: {value}\n")
-                    used_keys.add(key)
-            f.write("\n")
-
-            # Exposure settings
-            f.write("EXPOSURE SETTINGS:\n")
-            f.write("-" * 60 + "\n")
-            for field in exposure_fields:
-                key, value = find_field(field)
-                if key:
-                    # Format exposure time as fraction if needed
-                    if field == 'ExposureTime' and isinstance(value, float) and value < 1:
-                        f.write(f"{field:30s}: 1/{int(1/value)}s ({value:.6f}s)\n")
-                    else:
-                        f.write(f"{field:30s}: {value}\n")
-                    used_keys.add(key)
-            f.write("\n")
-
-            # Date/Time info
-            datetime_found = []
-            for field in datetime_fields:
-                key, value = find_field(field)
-                if key and key not in used_keys:
-                    datetime_found.append((field, value))
-                    used_keys.add(key)
-
-            if datetime_found:
-                f.write("DATE & TIME:\n")
-                f.write("-" * 60 + "\n")
-                for field, value in datetime_found:
-                    f.write(f"{field:30s}: {value}\n")
-                f.write("\n")
-
-            # Image dimensions and creator info
-            image_found = []
-            for field in image_fields:
-                key, value = find_field(field)
-                if key and key not in used_keys:
-                    image_found.append((field, value))
-                    used_keys.add(key)
-
-            if image_found:
-                f.write("IMAGE & CREATOR INFO:\n")
-                f.write("-" * 60 + "\n")
-                for field, value in image_found:
-                    f.write(f"{field:30s}: {value}\n")
-                f.write("\n")
-
-            # Serial numbers and firmware (bottom section)
-            serial_found = []
-            for field in serial_fields:
-                key, value = find_field(field)
-                if key and key not in used_keys:
-                    serial_found.append((field, value))
-                    used_keys.add(key)
-
-            if serial_found:
-                f.write("SERIAL NUMBERS & FIRMWARE:\n")
-                f.write("-" * 60 + "\n")
-                for field, value in serial_found:
-                    f.write(f"{field:30s}: {value}\n")
+        # Buffer every line and write the sidecar in one shot at the end
+        # instead of ~40 individual write calls
+        lines = []
+        append = lines.append
+
+        append("="*60 + "\n")
+        append(f"CR3 METADATA EXTRACTION\n")
+        append(f"Source File: {cr3_file.name}\n")
+        append(f"Extracted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        append("="*60 + "\n\n")
+
+        # Index metadata keys by base field name once: an exact
+        # (unprefixed) key beats any TIFFn_ one, and higher TIFF numbers
+        # beat lower ones as they're more accurate. Makes find_field a
+        # single dict lookup instead of probing TIFF10_..TIFF1_.
+        best_keys = {}
+        for key in metadata:
+            base, rank = key, 99
+            if key.startswith('TIFF'):
+                sep = key.find('_')
+                num = key[4:sep]
+                if sep > 4 and num.isdigit():
+                    base, rank = key[sep + 1:], int(num)
+            if base not in best_keys or rank > best_keys[base][0]:
+                best_keys[base] = (rank, key)
+
+        def find_field(field_name):
+            entry = best_keys.get(field_name)
+            if entry:
+                return entry[1], metadata[entry[1]]
+            return None, None
+
+        # Write metadata in organized sections
+        camera_lens_fields = ['Make', 'Model', 'LensModel', 'LensSpecification']
+        exposure_fields = ['ExposureTime', 'FNumber', 'ISOSpeedRatings', 'ShutterSpeedValue',
+                         'ApertureValue', 'ExposureBiasValue', 'FocalLength', 'FocalLengthIn35mmFilm',
+                         'ExposureProgram', 'ExposureMode', 'MeteringMode', 'WhiteBalance', 'Flash']
+        datetime_fields = ['DateTime', 'DateTimeOriginal', 'DateTimeDigitized']
+        image_fields = ['ImageWidth', 'ImageLength', 'Orientation', 'Artist', 'Copyright']
+        serial_fields = ['LensSerialNumber', 'LensManufacturingCode', 'FirmwareVersion']
+
+        used_keys = set()
+
+        # Camera & Lens info
+        append("CAMERA & LENS:\n")
+        append("-" * 60 + "\n")
+        for field in camera_lens_fields:
+            key, value = find_field(field)
+            if key:
+                append(f"{field:30s}: {value}\n")
+                used_keys.add(key)
+        append("\n")
+
+        # Exposure settings
+        append("EXPOSURE SETTINGS:\n")
+        append("-" * 60 + "\n")
+        for field in exposure_fields:
+            key, value = find_field(field)
+            if key:
+                # Format exposure time as fraction if needed
+                if field == 'ExposureTime' and isinstance(value, float) and value < 1:
+                    append(f"{field:30s}: 1/{int(1/value)}s ({value:.6f}s)\n")
+                else:
+                    append(f"{field:30s}: {value}\n")
+                used_keys.add(key)
+        append("\n")
+
+        # Date/Time info
+        datetime_found = []
+        for field in datetime_fields:
+            key, value = find_field(field)
+            if key and key not in used_keys:
+                datetime_found.append((field, value))
+                used_keys.add(key)
+
+        if datetime_found:
+            append("DATE & TIME:\n")
+            append("-" * 60 + "\n")
+            for field, value in datetime_found:
+                append(f"{field:30s}: {value}\n")
+            append("\n")
+
+        # Image dimensions and creator info
+        image_found = []
+        for field in image_fields:
+            key, value = find_field(field)
+            if key and key not in used_keys:
+                image_found.append((field, value))
+                used_keys.add(key)
+
+        if image_found:
+            append("IMAGE & CREATOR INFO:\n")
+            append("-" * 60 + "\n")
+            for field, value in image_found:
+                append(f"{field:30s}: {value}\n")
+            append("\n")
+
+        # Serial numbers and firmware (bottom section)
+        serial_found = []
+        for field in serial_fields:
+            key, value = find_field(field)
+            if key and key not in used_keys:
+                serial_found.append((field, value))
+                used_keys.add(key)
+
+        if serial_found:
+            append("SERIAL NUMBERS & FIRMWARE:\n")
+            append("-" * 60 + "\n")
+            for field, value in serial_found:
+                append(f"{field:30s}: {value}\n")
+
+        Path(sidecar_path).write_text(''.join(lines), encoding='utf-8')
 
         return sidecar_path
 
@@ -523,29 +551,33 @@ def process_cr3_file(file_path):
     Processes a single CR3 file: validates, extracts metadata, writes sidecar.
     """
     file_path = Path(file_path)
+    file_name = file_path.name
 
-    # Check if sidecar already exists
+    # Check if sidecar already exists (single stat, built once and reused)
     sidecar_path = file_path.parent / f"{file_path.stem}_metadata.txt"
-    if sidecar_path.exists():
+    try:
+        sidecar_path.stat()
         print(f"  [SKIP] Sidecar already exists: {sidecar_path.name}")
         return False
+    except FileNotFoundError:
+        pass
 
     # Validate CR3
     if not is_cr3_file(file_path):
-        print(f"  [ERROR] Not a valid CR3 file: {file_path.name}")
+        print(f"  [ERROR] Not a valid CR3 file: {file_name}")
         return False
 
-    print(f"  [PROCESSING] {file_path.name}")
+    print(f"  [PROCESSING] {file_name}")
 
     # Extract metadata
     metadata = extract_metadata(file_path)
 
     if metadata is None or len(metadata) == 0:
-        print(f"  [ERROR] Failed to extract metadata from {file_path.name}")
+        print(f"  [ERROR] Failed to extract metadata from {file_name}")
         return False
 
     # Write sidecar
-    sidecar = write_sidecar(file_path, metadata)
+    sidecar = write_sidecar(file_path, sidecar_path, metadata)
 
     if sidecar:
         print(f"  [SUCCESS] Created sidecar: {sidecar.name}")
@@ -574,10 +606,11 @@ def batch_process_folder(folder_path):
     print(f"\n[INFO] Found {len(cr3_files)} CR3 file(s) in {folder.name}/")
     print("="*60)
 
-    success_count = 0
-    for cr3_file in cr3_files:
-        if process_cr3_file(cr3_file):
-            success_count += 1
+    # Each file is fully independent (own read, own sidecar write), so
+    # fan the batch out across one worker process per core
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(process_cr3_file, cr3_files, chunksize=4))
+    success_count = sum(1 for result in results if result)
 
     print("="*60)
     print(f"[COMPLETE] Processed {success_count}/{len(cr3_files)} files successfully\n")
@@ -3,10 +3,19 @@
 #imports
 from pathlib import Path
 from datetime import datetime
-import shutil
+from collections import namedtuple, defaultdict
+from functools import lru_cache
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import sys
+import time
 import struct
-import binascii
+import re
+import mmap
+import ctypes
+import fcntl
+import platform
 import tkinter as tk
 from tkinter import filedialog
 
@@ -14,7 +23,7 @@ from tkinter import filedialog
 #constants
 VOLUMES_PATH = Path("/Volumes")
 SKIP_VOLUMES = {"Macintosh HD", "Macintosh HD - Data"} # future improvement, enhanced drive detection
-PHOTO_EXTENSIONS = {
+PHOTO_EXTENSIONS = frozenset({
     # Standard Images
     ".jpg", ".jpeg", ".png", ".heic", ".tiff", ".tif",
     # Generic RAW: / Adobe / DJI / Ricoh
@@ -40,19 +49,120 @@ PHOTO_EXTENSIONS = {
 
     # Video - Currently disabled
     # ".mp4", ".mov", ".avi", ".m4v", ".mxf", ".lrf" ".r3d",
-}
+})
+
+# Extensions as a tuple for str.endswith - a single C-level membership
+# test per filename instead of splitting off the suffix and probing a set
+_EXT_TUPLE = tuple(PHOTO_EXTENSIONS)
+
+# Lightweight per-photo record carrying the stat data captured during the
+# scan (free on the DirEntry), so later stages never re-stat the file
+PhotoInfo = namedtuple("PhotoInfo", ["path", "name", "size", "mtime"])
+
+
+# --- statx fast path (Linux only) ---
+# statx with AT_STATX_DONT_SYNC answers from the kernel cache without
+# forcing a device round-trip, which matters on SD cards and NFS.
+# macOS has no statx; there the DirEntry stat() path is used as-is.
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_SIZE = 0x0200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_int64),
+                ("tv_nsec", ctypes.c_uint32),
+                ("_reserved", ctypes.c_int32)]
+
+
+class _Statx(ctypes.Structure):
+    _fields_ = [("stx_mask", ctypes.c_uint32),
+                ("stx_blksize", ctypes.c_uint32),
+                ("stx_attributes", ctypes.c_uint64),
+                ("stx_nlink", ctypes.c_uint32),
+                ("stx_uid", ctypes.c_uint32),
+                ("stx_gid", ctypes.c_uint32),
+                ("stx_mode", ctypes.c_uint16),
+                ("_spare0", ctypes.c_uint16),
+                ("stx_ino", ctypes.c_uint64),
+                ("stx_size", ctypes.c_uint64),
+                ("stx_blocks", ctypes.c_uint64),
+                ("stx_attributes_mask", ctypes.c_uint64),
+                ("stx_atime", _StatxTimestamp),
+                ("stx_btime", _StatxTimestamp),
+                ("stx_ctime", _StatxTimestamp),
+                ("stx_mtime", _StatxTimestamp),
+                ("stx_rdev_major", ctypes.c_uint32),
+                ("stx_rdev_minor", ctypes.c_uint32),
+                ("stx_dev_major", ctypes.c_uint32),
+                ("stx_dev_minor", ctypes.c_uint32),
+                ("stx_mnt_id", ctypes.c_uint64),
+                ("stx_dio_mem_align", ctypes.c_uint32),
+                ("stx_dio_offset_align", ctypes.c_uint32),
+                ("_spare1", ctypes.c_uint64 * 12)]
+
+
+_statx_size_mtime = None
+if platform.system() == "Linux":
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.statx
+    except (OSError, AttributeError):
+        pass
+    else:
+        def _statx_size_mtime(path):
+            """Return (size, mtime) from cached metadata, or None on any
+            failure (including ENOSYS on kernels before 4.11)."""
+            buf = _Statx()
+            ret = _libc.statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC,
+                              _STATX_TYPE | _STATX_SIZE | _STATX_MTIME,
+                              ctypes.byref(buf))
+            if ret != 0:
+                return None
+            # The mask argument is a request, not a guarantee: the kernel
+            # reports what it actually filled in via stx_mask
+            if (buf.stx_mask & (_STATX_SIZE | _STATX_MTIME)) != (_STATX_SIZE | _STATX_MTIME):
+                return None
+            return buf.stx_size, buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9
 
 # TIFF signatures for EXIF parsing
 TIFF_SIGNATURE_LE = b'\x49\x49\x2A\x00'  # Little-endian (Intel)
 TIFF_SIGNATURE_BE = b'\x4D\x4D\x00\x2A'  # Big-endian (Motorola)
 
+# Precompiled structs per byte order: (u16, 12-byte IFD entry, u32).
+# struct.unpack re-parses the format string on every call; the IFD loop
+# runs up to 200 entries per file, so compile the formats once
+_EXIF_STRUCTS = {
+    '<': (struct.Struct('<H'), struct.Struct('<HHI'), struct.Struct('<I')),
+    '>': (struct.Struct('>H'), struct.Struct('>HHI'), struct.Struct('>I')),
+}
+
+# Both TIFF signatures in one scan: finditer touches each byte once
+# instead of two independent find passes over the search window
+_TIFF_SIG_RE = re.compile(b'II\\*\\x00|MM\\x00\\*')
+
 # Canon CR3 UUID for metadata location
 CANON_CMT1_UUID = "85c0b687820f11e08111f4ce462b6a48"
+CANON_CMT1_UUID_BYTES = bytes.fromhex(CANON_CMT1_UUID)
+
+# ISO BMFF boxes the CR3 walk descends into rather than skips over
+_CR3_CONTAINER_BOXES = frozenset((b'moov', b'trak', b'mdia', b'minf', b'stbl'))
 
 # EXIF tag IDs
 EXIF_TAG_DATETIME_ORIGINAL = 36867
 EXIF_TAG_EXIF_IFD_POINTER = 34665
 
+# Byte-level signatures of the two tag IDs for the prescan, per byte order
+_IFD_TAG_SIGS = {
+    '<': (EXIF_TAG_DATETIME_ORIGINAL.to_bytes(2, 'little'),
+          EXIF_TAG_EXIF_IFD_POINTER.to_bytes(2, 'little')),
+    '>': (EXIF_TAG_DATETIME_ORIGINAL.to_bytes(2, 'big'),
+          EXIF_TAG_EXIF_IFD_POINTER.to_bytes(2, 'big')),
+}
+
 # File extensions by parser type
 CR3_EXTENSIONS = {".cr3"}
 TIFF_BASED_RAW_EXTENSIONS = {".cr2", ".nef", ".nrw", ".pef", ".iiq", ".3fr", ".fff", ".dng"}
@@ -63,6 +173,25 @@ _fallback_approved = None
 
 DESTINATIONS_FILE = Path(__file__).parent / "destinations.txt"
 
+# Worker threads for EXIF reading; card readers and NAS mounts serve
+# concurrent small reads well, so overlapping the latency pays off
+EXIF_WORKERS = 16
+
+# Shared pool plus per-photo futures so EXIF reads can start while the
+# directory scan is still walking, instead of only after it finishes
+_exif_pool = None
+_exif_futures = {}
+
+def _get_exif_pool():
+    global _exif_pool
+    if _exif_pool is None:
+        _exif_pool = ThreadPoolExecutor(max_workers=EXIF_WORKERS)
+    return _exif_pool
+
+# Worker threads per copy batch; overlaps reads from the card with
+# writes to the destination (and across destination disks)
+COPY_WORKERS = 8
+
 # --- EXIF Parsing Functions ---
 
 def _parse_date_string(date_str):
@@ -72,43 +201,54 @@ def _parse_date_string(date_str):
     except (ValueError, AttributeError):
         return None
 
-def _find_datetime_in_ifd(f, ifd_offset, tiff_base, byte_order):
-    """Parse IFD entries looking for DateTimeOriginal, following ExifIFD pointer if needed."""
+def _aligned_hits(block, sig):
+    """Offsets of sig occurrences sitting on a 12-byte entry boundary."""
+    hits = []
+    idx = block.find(sig)
+    while idx != -1:
+        if idx % 12 == 0:
+            hits.append(idx)
+        idx = block.find(sig, idx + 1)
+    return hits
+
+def _find_datetime_in_ifd(buf, ifd_offset, tiff_base, byte_order):
+    """Parse IFD entries looking for DateTimeOriginal, following ExifIFD pointer if needed.
+
+    buf is any random-access buffer over the whole file (mmap or bytes);
+    entries are unpacked in place, no seeks or per-entry reads.
+    """
     try:
-        f.seek(tiff_base + ifd_offset)
-        num_entries = struct.unpack(f'{byte_order}H', f.read(2))[0]
+        u16, ifd_entry, u32 = _EXIF_STRUCTS[byte_order]
+
+        pos = tiff_base + ifd_offset
+        num_entries = u16.unpack_from(buf, pos)[0]
 
         if num_entries > 200:  # Sanity check
             return None
 
-        for _ in range(num_entries):
-            entry = f.read(12)
-            if len(entry) < 12:
-                return None
-
-            tag_id, tag_type, count = struct.unpack(f'{byte_order}HHI', entry[0:8])
-            value_data = entry[8:12]
+        # Pre-scan the raw entry block for the two tag IDs we care
+        # about: a C-level find over the block beats unpacking every
+        # 12-byte entry in Python, and most IFDs contain neither tag.
+        # An aligned hit sits at an entry start, so it IS the tag ID.
+        block = bytes(buf[pos + 2:pos + 2 + 12 * num_entries])
+        date_sig, exif_sig = _IFD_TAG_SIGS[byte_order]
+
+        # Found DateTimeOriginal
+        for entry_pos in _aligned_hits(block, date_sig):
+            tag_id, tag_type, count = ifd_entry.unpack_from(block, entry_pos)
+            if count <= 4:
+                raw = block[entry_pos + 8:entry_pos + 12]
+            else:
+                offset = u32.unpack_from(block, entry_pos + 8)[0]
+                raw = bytes(buf[tiff_base + offset:tiff_base + offset + count])
+            return raw.split(b'\x00')[0].decode('utf-8', errors='ignore')
 
-            # Found DateTimeOriginal
-            if tag_id == EXIF_TAG_DATETIME_ORIGINAL:
-                if count <= 4:
-                    return value_data.split(b'\x00')[0].decode('utf-8', errors='ignore')
-                else:
-                    offset = struct.unpack(f'{byte_order}I', value_data)[0]
-                    current_pos = f.tell()
-                    f.seek(tiff_base + offset)
-                    date_str = f.read(count).split(b'\x00')[0].decode('utf-8', errors='ignore')
-                    f.seek(current_pos)
-                    return date_str
-
-            # Follow ExifIFD pointer
-            if tag_id == EXIF_TAG_EXIF_IFD_POINTER:
-                exif_offset = struct.unpack(f'{byte_order}I', value_data)[0]
-                current_pos = f.tell()
-                result = _find_datetime_in_ifd(f, exif_offset, tiff_base, byte_order)
-                if result:
-                    return result
-                f.seek(current_pos)
+        # Follow ExifIFD pointer
+        for entry_pos in _aligned_hits(block, exif_sig):
+            exif_offset = u32.unpack_from(block, entry_pos + 8)[0]
+            result = _find_datetime_in_ifd(buf, exif_offset, tiff_base, byte_order)
+            if result:
+                return result
 
         return None
     except Exception:
@@ -118,25 +258,25 @@ def _extract_date_from_tiff_raw(file_path):
     """Extract DateTimeOriginal from TIFF-based RAW files (CR2, NEF, DNG, etc.)."""
     try:
         with open(file_path, 'rb') as f:
-            header = f.read(8)
-            if len(header) < 8:
-                return None
-
-            # Check for TIFF signature and determine byte order
-            if header[0:4] == TIFF_SIGNATURE_LE:
-                byte_order = '<'
-            elif header[0:4] == TIFF_SIGNATURE_BE:
-                byte_order = '>'
-            else:
-                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if len(mm) < 8:
+                    return None
+
+                # Check for TIFF signature and determine byte order
+                if mm[0:4] == TIFF_SIGNATURE_LE:
+                    byte_order = '<'
+                elif mm[0:4] == TIFF_SIGNATURE_BE:
+                    byte_order = '>'
+                else:
+                    return None
 
-            # Get IFD0 offset
-            ifd_offset = struct.unpack(f'{byte_order}I', header[4:8])[0]
-            if ifd_offset < 8 or ifd_offset > 65536:
-                return None
+                # Get IFD0 offset
+                ifd_offset = _EXIF_STRUCTS[byte_order][2].unpack_from(mm, 4)[0]
+                if ifd_offset < 8 or ifd_offset > 65536:
+                    return None
 
-            date_str = _find_datetime_in_ifd(f, ifd_offset, 0, byte_order)
-            return _parse_date_string(date_str) if date_str else None
+                date_str = _find_datetime_in_ifd(mm, ifd_offset, 0, byte_order)
+                return _parse_date_string(date_str) if date_str else None
     except Exception:
         return None
 
@@ -144,50 +284,42 @@ def _extract_date_from_raf(file_path):
     """Extract DateTimeOriginal from Fujifilm RAF files."""
     try:
         with open(file_path, 'rb') as f:
-            # Check for FUJIFILM header
-            header = f.read(8)
-            if not header.startswith(b'FUJIFILM'):
-                return None
-
-            # Read EXIF offset at byte 84 (UInt32)
-            f.seek(84)
-            exif_offset = struct.unpack('>I', f.read(4))[0]
-
-            if exif_offset == 0 or exif_offset > 10000000:
-                return None
-
-            # RAF files embed a JPEG with EXIF in APP1 segment
-            # The offset points to JPEG SOI marker (FFD8), followed by APP1 (FFE1)
-            # Structure: FFD8 FFE1 [2-byte length] "Exif\x00\x00" [TIFF data]
-            f.seek(exif_offset)
-            jpeg_header = f.read(12)
-            if len(jpeg_header) < 12:
-                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Check for FUJIFILM header
+                if mm[0:8] != b'FUJIFILM':
+                    return None
+
+                # Read EXIF offset at byte 84 (UInt32)
+                exif_offset = _EXIF_STRUCTS['>'][2].unpack_from(mm, 84)[0]
+
+                if exif_offset == 0 or exif_offset > 10000000:
+                    return None
+
+                # RAF files embed a JPEG with EXIF in APP1 segment
+                # The offset points to JPEG SOI marker (FFD8), followed by APP1 (FFE1)
+                # Structure: FFD8 FFE1 [2-byte length] "Exif\x00\x00" [TIFF data]
+                # Check for JPEG SOI + APP1 markers
+                if mm[exif_offset:exif_offset + 4] == b'\xff\xd8\xff\xe1':
+                    # Skip: SOI(2) + APP1 marker(2) + length(2) + "Exif\x00\x00"(6) = 12 bytes
+                    tiff_base = exif_offset + 12
+                else:
+                    # Fallback: try direct TIFF header
+                    tiff_base = exif_offset
 
-            # Check for JPEG SOI + APP1 markers
-            if jpeg_header[0:4] == b'\xff\xd8\xff\xe1':
-                # Skip: SOI(2) + APP1 marker(2) + length(2) + "Exif\x00\x00"(6) = 12 bytes
-                tiff_base = exif_offset + 12
-                f.seek(tiff_base)
-                tiff_header = f.read(8)
-            else:
-                # Fallback: try direct TIFF header
-                tiff_base = exif_offset
-                tiff_header = jpeg_header[0:8]
+                tiff_header = mm[tiff_base:tiff_base + 8]
+                if len(tiff_header) < 8:
+                    return None
 
-            if len(tiff_header) < 8:
-                return None
-
-            if tiff_header[0:4] == TIFF_SIGNATURE_LE:
-                byte_order = '<'
-            elif tiff_header[0:4] == TIFF_SIGNATURE_BE:
-                byte_order = '>'
-            else:
-                return None
+                if tiff_header[0:4] == TIFF_SIGNATURE_LE:
+                    byte_order = '<'
+                elif tiff_header[0:4] == TIFF_SIGNATURE_BE:
+                    byte_order = '>'
+                else:
+                    return None
 
-            ifd_offset = struct.unpack(f'{byte_order}I', tiff_header[4:8])[0]
-            date_str = _find_datetime_in_ifd(f, ifd_offset, tiff_base, byte_order)
-            return _parse_date_string(date_str) if date_str else None
+                ifd_offset = _EXIF_STRUCTS[byte_order][2].unpack_from(tiff_header, 4)[0]
+                date_str = _find_datetime_in_ifd(mm, ifd_offset, tiff_base, byte_order)
+                return _parse_date_string(date_str) if date_str else None
     except Exception:
         return None
 
@@ -195,69 +327,59 @@ def _extract_date_from_cr3(file_path):
     """Extract DateTimeOriginal from Canon CR3 files (ISO BMFF format)."""
     try:
         with open(file_path, 'rb') as f:
-            file_size = os.path.getsize(file_path)
-
-            while f.tell() < file_size:
-                box_start = f.tell()
-                header = f.read(8)
-                if len(header) < 8:
-                    break
-
-                box_size = struct.unpack('>I', header[0:4])[0]
-                box_type = header[4:8].decode('utf-8', errors='ignore')
-
-                header_len = 8
-                if box_size == 1:
-                    ext_size = f.read(8)
-                    if len(ext_size) < 8:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                file_size = len(mm)
+                pos = 0
+
+                while pos + 8 <= file_size:
+                    box_start = pos
+                    # int.from_bytes is the C fast path for one-off
+                    # big-endian reads; no format string, no tuple
+                    box_size = int.from_bytes(mm[pos:pos + 4], 'big')
+                    # Raw bytes compare; decoding every box type to str
+                    # costs a UTF-8 pass per box for no benefit
+                    box_type = mm[pos + 4:pos + 8]
+
+                    header_len = 8
+                    if box_size == 1:
+                        if pos + 16 > file_size:
+                            break
+                        box_size = int.from_bytes(mm[pos + 8:pos + 16], 'big')
+                        header_len = 16
+
+                    if box_size == 0 or box_size > file_size:
                         break
-                    box_size = struct.unpack('>Q', ext_size)[0]
-                    header_len = 16
-
-                if box_size == 0 or box_size > file_size:
-                    break
-
-                if box_type == 'uuid':
-                    uuid_bytes = f.read(16)
-                    uuid_hex = binascii.hexlify(uuid_bytes).decode('utf-8')
-
-                    if uuid_hex == CANON_CMT1_UUID:
-                        # CR3 CMT1 box contains multiple TIFF structures
-                        # Search through all TIFF headers for DateTimeOriginal
-                        search_start = f.tell()
-                        chunk = f.read(min(200000, box_size - header_len - 16))
-
-                        # Find all TIFF signatures and check each for DateTimeOriginal
-                        search_pos = 0
-                        while search_pos < len(chunk) - 8:
-                            tiff_idx = chunk.find(TIFF_SIGNATURE_LE, search_pos)
-                            if tiff_idx == -1:
-                                tiff_idx = chunk.find(TIFF_SIGNATURE_BE, search_pos)
-                            if tiff_idx == -1:
-                                break
-
-                            tiff_base = search_start + tiff_idx
-
-                            if chunk[tiff_idx:tiff_idx+2] == b'II':
-                                byte_order = '<'
-                            else:
-                                byte_order = '>'
-
-                            ifd_offset = struct.unpack(f'{byte_order}I', chunk[tiff_idx+4:tiff_idx+8])[0]
-
-                            if 8 <= ifd_offset <= 50000:
-                                date_str = _find_datetime_in_ifd(f, ifd_offset, tiff_base, byte_order)
-                                if date_str:
-                                    return _parse_date_string(date_str)
-
-                            # Move past this TIFF signature to find the next one
-                            search_pos = tiff_idx + 1
-
-                # Navigate container boxes
-                if box_type in ['moov', 'trak', 'mdia', 'minf', 'stbl']:
-                    f.seek(box_start + header_len)
-                else:
-                    f.seek(box_start + box_size)
+
+                    if box_type == b'uuid':
+                        uuid_bytes = mm[box_start + header_len:box_start + header_len + 16]
+
+                        if uuid_bytes == CANON_CMT1_UUID_BYTES:
+                            # CR3 CMT1 box contains multiple TIFF structures
+                            # Search through all TIFF headers for DateTimeOriginal;
+                            # one regex pass over the mapped pages yields both
+                            # byte orders in file order
+                            search_start = box_start + header_len + 16
+                            search_end = search_start + min(200000, box_size - header_len - 16)
+
+                            for match in _TIFF_SIG_RE.finditer(mm, search_start, search_end):
+                                tiff_base = match.start()
+                                byte_order = '<' if mm[tiff_base] == 0x49 else '>'
+                                ifd_offset = _EXIF_STRUCTS[byte_order][2].unpack_from(mm, tiff_base + 4)[0]
+
+                                if 8 <= ifd_offset <= 50000:
+                                    date_str = _find_datetime_in_ifd(mm, ifd_offset, tiff_base, byte_order)
+                                    if date_str:
+                                        return _parse_date_string(date_str)
+
+                            # The CMT1 uuid appears once per file; if its
+                            # window held no date, walking on won't help
+                            return None
+
+                    # Navigate container boxes
+                    if box_type in _CR3_CONTAINER_BOXES:
+                        pos = box_start + header_len
+                    else:
+                        pos = box_start + box_size
 
         return None
     except Exception:
@@ -267,43 +389,43 @@ def _extract_date_generic_scan(file_path):
     """Fallback: scan first 4KB for TIFF signature if not at byte 0."""
     try:
         with open(file_path, 'rb') as f:
-            # First check byte 0
-            header = f.read(8)
-            if len(header) >= 8:
-                if header[0:4] == TIFF_SIGNATURE_LE:
-                    ifd_offset = struct.unpack('<I', header[4:8])[0]
-                    if 8 <= ifd_offset <= 65536:
-                        date_str = _find_datetime_in_ifd(f, ifd_offset, 0, '<')
-                        if date_str:
-                            return _parse_date_string(date_str)
-                elif header[0:4] == TIFF_SIGNATURE_BE:
-                    ifd_offset = struct.unpack('>I', header[4:8])[0]
-                    if 8 <= ifd_offset <= 65536:
-                        date_str = _find_datetime_in_ifd(f, ifd_offset, 0, '>')
-                        if date_str:
-                            return _parse_date_string(date_str)
-
-            # Scan first 4KB for TIFF signature
-            f.seek(0)
-            chunk = f.read(4096)
-
-            for sig, byte_order in [(TIFF_SIGNATURE_LE, '<'), (TIFF_SIGNATURE_BE, '>')]:
-                idx = chunk.find(sig)
-                if idx != -1 and idx + 8 <= len(chunk):
-                    ifd_offset = struct.unpack(f'{byte_order}I', chunk[idx+4:idx+8])[0]
-                    if 8 <= ifd_offset <= 50000:
-                        date_str = _find_datetime_in_ifd(f, ifd_offset, idx, byte_order)
-                        if date_str:
-                            return _parse_date_string(date_str)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # First check byte 0
+                if len(mm) >= 8:
+                    if mm[0:4] == TIFF_SIGNATURE_LE:
+                        ifd_offset = _EXIF_STRUCTS['<'][2].unpack_from(mm, 4)[0]
+                        if 8 <= ifd_offset <= 65536:
+                            date_str = _find_datetime_in_ifd(mm, ifd_offset, 0, '<')
+                            if date_str:
+                                return _parse_date_string(date_str)
+                    elif mm[0:4] == TIFF_SIGNATURE_BE:
+                        ifd_offset = _EXIF_STRUCTS['>'][2].unpack_from(mm, 4)[0]
+                        if 8 <= ifd_offset <= 65536:
+                            date_str = _find_datetime_in_ifd(mm, ifd_offset, 0, '>')
+                            if date_str:
+                                return _parse_date_string(date_str)
+
+                # Scan first 4KB for TIFF signature, both byte orders at once
+                for match in _TIFF_SIG_RE.finditer(mm, 0, min(4096, len(mm))):
+                    idx = match.start()
+                    if idx + 8 <= len(mm):
+                        byte_order = '<' if mm[idx] == 0x49 else '>'
+                        ifd_offset = _EXIF_STRUCTS[byte_order][2].unpack_from(mm, idx + 4)[0]
+                        if 8 <= ifd_offset <= 50000:
+                            date_str = _find_datetime_in_ifd(mm, ifd_offset, idx, byte_order)
+                            if date_str:
+                                return _parse_date_string(date_str)
 
         return None
     except Exception:
         return None
 
-def _get_exif_date(photo_path):
-    """Dispatcher: route to appropriate parser based on file extension."""
-    ext = photo_path.suffix.lower()
+def _get_exif_date(photo_path, ext):
+    """Dispatcher: route to appropriate parser based on file extension.
 
+    ext is the lowered, dotted extension the scan already derived; no
+    Path suffix parsing happens here.
+    """
     if ext in CR3_EXTENSIONS:
         return _extract_date_from_cr3(photo_path)
     elif ext in TIFF_BASED_RAW_EXTENSIONS:
@@ -316,28 +438,89 @@ def _get_exif_date(photo_path):
 #functions
 def find_sd_card():
     """Scan /Volumes for a drive with DCIM folder at the top level."""
-    for volume in VOLUMES_PATH.iterdir():
-        if volume.name in SKIP_VOLUMES:
-            continue
-        dcim = volume / "DCIM"
-        if dcim.exists():
-            return dcim
-    return None
+    try:
+        with os.scandir(VOLUMES_PATH) as it:
+            volumes = [entry.path for entry in it
+                       if entry.name not in SKIP_VOLUMES and entry.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return None
+
+    if not volumes:
+        return None
+
+    # Probe the candidates concurrently and take the first hit without
+    # joining the rest, so one stalled network mount can't block the scan
+    # once a real card has answered (a truly wedged probe thread can
+    # still delay interpreter exit, but not the copy run itself)
+    dcim_paths = [os.path.join(volume, "DCIM") for volume in volumes]
+    executor = ThreadPoolExecutor(max_workers=len(dcim_paths))
+    try:
+        futures = {executor.submit(os.path.isdir, path): path
+                   for path in dcim_paths}
+        for future in as_completed(futures):
+            if future.result():
+                return Path(futures[future])
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _scandir_recursive(path):
+    """Recursively yield DirEntry objects for files under path.
+
+    os.scandir reuses the type info the OS already returned from readdir,
+    so this avoids the per-entry stat that pathlib's rglob incurs.
+    pathlib globbing is deliberately kept off this hot path: even after
+    the upstream rewrites it still builds a Path object per entry, which
+    benchmarks a few times slower than a raw scandir walk on big trees.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except PermissionError:
+        return
 
 def find_photos(dcim_path):
     """Find all photos in the DCIM folder and its subfolders."""
     photos = []
-    for file in dcim_path.rglob("*"):
-        if file.suffix.lower() in PHOTO_EXTENSIONS:
-            photos.append(file)
+    for entry in _scandir_recursive(dcim_path):
+        name = entry.name
+        low = name.lower()
+        if low.endswith(_EXT_TUPLE):
+            info = _statx_size_mtime(entry.path) if _statx_size_mtime else None
+            if info is None:
+                stat = entry.stat()
+                info = (stat.st_size, stat.st_mtime)
+            photo = PhotoInfo(entry.path, name, info[0], info[1])
+            photos.append(photo)
+            # Kick off the EXIF read now; the result is collected later
+            # in get_all_photo_dates while the walk continues
+            ext = '.' + low.rpartition('.')[2]
+            _exif_futures[photo] = _get_exif_pool().submit(_get_exif_date, photo.path, ext)
     return photos
 
+# One hidden Tk root shared by every dialog: booting Tk costs a few
+# hundred ms on macOS, and the destroy/quit dance only needs to happen
+# once, at exit
+_tk_root_instance = None
+
+def _tk_root():
+    global _tk_root_instance
+    if _tk_root_instance is None:
+        _tk_root_instance = tk.Tk()
+        _tk_root_instance.withdraw()  # Hide the main window
+        _tk_root_instance.attributes('-topmost', True)  # Bring dialog to front
+        # Fully clean up tkinter at exit to prevent macOS terminal issues
+        atexit.register(_tk_root_instance.destroy)
+    _tk_root_instance.update()  # Process any pending events
+    return _tk_root_instance
+
 def select_source_files():
     """Open a file dialog to select photo files."""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    root.attributes('-topmost', True)  # Bring dialog to front
-    root.update()  # Process any pending events
+    _tk_root()
 
     # Build file type filter from PHOTO_EXTENSIONS
     extensions = " ".join(f"*{ext}" for ext in sorted(PHOTO_EXTENSIONS))
@@ -351,12 +534,11 @@ def select_source_files():
         filetypes=filetypes
     )
 
-    # Fully clean up tkinter to prevent macOS terminal issues
-    root.update()
-    root.destroy()
-    root.quit()
-
-    return [Path(f) for f in files] if files else []
+    photos = []
+    for f in files:
+        stat = os.stat(f)
+        photos.append(PhotoInfo(f, os.path.basename(f), stat.st_size, stat.st_mtime))
+    return photos
 
 def get_all_photo_dates(photos):
     """Get dates for all photos, preferring EXIF DateTimeOriginal."""
@@ -364,9 +546,22 @@ def get_all_photo_dates(photos):
     dates = {}
     fallback_needed = []
 
-    for i, photo in enumerate(photos, 1):
-        print(f"Reading EXIF data: {i}/{len(photos)}    ", end="\r")
-        exif_date = _get_exif_date(photo)
+    # EXIF reads are latency-bound (many tiny reads per file), so they
+    # run on the shared pool; photos from the SD-card scan usually have
+    # a future already in flight, manually picked files get one here
+    pool = _get_exif_pool()
+    futures = [_exif_futures.pop(photo, None)
+               or pool.submit(_get_exif_date, photo.path,
+                              '.' + photo.name.rpartition('.')[2].lower())
+               for photo in photos]
+    last_update = 0.0
+    for i, (photo, future) in enumerate(zip(photos, futures), 1):
+        exif_date = future.result()
+        now = time.monotonic()
+        if now - last_update > 0.1 or i == len(photos):
+            last_update = now
+            sys.stdout.write(f"\rReading EXIF data: {i}/{len(photos)}    ")
+            sys.stdout.flush()
         if exif_date:
             dates[photo] = exif_date
         else:
@@ -388,8 +583,7 @@ def get_all_photo_dates(photos):
 
         if _fallback_approved:
             for photo in fallback_needed:
-                timestamp = photo.stat().st_mtime
-                dates[photo] = datetime.fromtimestamp(timestamp).date()
+                dates[photo] = datetime.fromtimestamp(photo.mtime).date()
         else:
             print(f"Skipping {len(fallback_needed)} files without EXIF dates.")
 
@@ -402,40 +596,33 @@ def group_photos_by_date(photos):
     dates = get_all_photo_dates(photos)
     print(f"Got dates for {len(dates)} photos")
     
-    grouped = {}
+    grouped = defaultdict(list)
     for photo, date in dates.items():
-        if date not in grouped:
-            grouped[date] = []
         grouped[date].append(photo)
-    return grouped
+    return dict(grouped)
 
 def select_directory():
     """Open a file dialog to select a directory."""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    root.attributes('-topmost', True)  # Bring dialog to front
-    root.update()  # Process any pending events
+    _tk_root()
     directory = filedialog.askdirectory(title="Select Destination Directory")
 
-    # Fully clean up tkinter to prevent macOS terminal issues
-    root.update()
-    root.destroy()
-    root.quit()
-
     return directory
 
 def load_destinations():
     """Load any saved file destinations from txt file."""
-    if not DESTINATIONS_FILE.exists():
+    try:
+        text = DESTINATIONS_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return []
-    with open(DESTINATIONS_FILE, "r") as file:
-        return [line.strip() for line in file if line.strip()]
+    return [line.strip() for line in text.splitlines() if line.strip()]
 
 def save_destinations(destinations):
     """Save new destinations to text file."""
-    with open(DESTINATIONS_FILE, "w") as file:
-        for destination in destinations:
-            file.write(destination + "\n")
+    # One write to a temp file, then an atomic rename: a crash mid-save
+    # can't leave a truncated destinations list behind
+    tmp_file = DESTINATIONS_FILE.with_suffix(".tmp")
+    tmp_file.write_text("\n".join(destinations) + "\n", encoding="utf-8")
+    os.replace(tmp_file, DESTINATIONS_FILE)
 
 def get_destinations():
     """Show destinations menu and get user selections."""
@@ -500,18 +687,16 @@ def get_destinations():
             except (ValueError, IndexError):
                 print("Invalid selection. Try again?")
 
+# Invalid characters for most filesystems: / \ : * ? " < > |
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '/\\:*?"<>|'})
+
 def sanitize_shoot_name(name):
     """Remove or replace characters that are invalid in filesystem paths."""
     if not name:
         return ""
-    # Invalid characters for most filesystems: / \ : * ? " < > |
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    sanitized = name
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, '_')
-    # Remove leading/trailing whitespace and dots (problematic on some systems)
-    sanitized = sanitized.strip('. ')
-    return sanitized
+    # Single C-level pass over the string; also strip leading/trailing
+    # whitespace and dots (problematic on some systems)
+    return name.translate(_SANITIZE_TABLE).strip('. ')
 
 def get_shoot_name():
     """Asks the user for a shoot name to add to the destination folder"""
@@ -523,20 +708,20 @@ def get_shoot_name():
         print(f"Note: Shoot name sanitized to: '{sanitized}'")
     return sanitized
 
+_SIZE_UNITS = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
+
 def format_file_size(size_bytes):
     """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    # bit_length picks the unit directly: every 10 bits is one step up
+    unit = min(len(_SIZE_UNITS) - 1, max(0, (size_bytes.bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (10 * unit)):.2f} {_SIZE_UNITS[unit]}"
 
 def calculate_total_size(grouped_photos):
     """Calculate total size of all photos to be copied."""
     total_bytes = 0
     for photos in grouped_photos.values():
         for photo in photos:
-            total_bytes += photo.stat().st_size
+            total_bytes += photo.size
     return total_bytes
 
 def confirm_copy(grouped_photos, destinations, shoot_name):
@@ -557,16 +742,26 @@ def confirm_copy(grouped_photos, destinations, shoot_name):
     answer = input("\nProceed with copy? (y/n): ").strip().lower()
     return answer in ["y", "yes"]
 
+def _existing_names(folder):
+    """Snapshot the filenames already in folder with one directory read."""
+    try:
+        return set(os.listdir(folder))
+    except FileNotFoundError:
+        return set()
+
 def check_conflicts(grouped_photos, destinations, shoot_name):
     """Check if any files already exist at destinations."""
     conflicts = []
     for dest in destinations:
         for date, photos in grouped_photos.items():
             folder = build_folder_path(dest, date, shoot_name)
+            # One directory listing replaces a stat probe per photo
+            existing = _existing_names(folder)
+            if not existing:
+                continue
             for photo in photos:
-                dest_file = folder / photo.name
-                if dest_file.exists():
-                    conflicts.append(dest_file)
+                if photo.name in existing:
+                    conflicts.append(folder / photo.name)
     return conflicts
 
 def handle_conflicts():
@@ -587,84 +782,244 @@ def handle_conflicts():
             return choice
         print("Invalid choice. Enter s, o, or r.")
 
+@lru_cache(maxsize=None)
 def build_folder_path(base_path, date, shoot_name):
-    """Build the destination folder path: base/yyyy/yyyy-mm/yyyy-mm-dd Shoot Name."""
-    year = date.strftime("%Y")
-    year_month = date.strftime("%Y-%m")
-    if shoot_name:
-        folder_name = date.strftime("%Y-%m-%d") + " " + shoot_name
-    else:
-        folder_name = date.strftime("%Y-%m-%d")
+    """Build the destination folder path: base/yyyy/yyyy-mm/yyyy-mm-dd Shoot Name.
+
+    Cached: check_conflicts and copy_photos both ask for the same
+    (destination, date) handful over and over.
+    """
+    # f-string formatting; strftime goes through C locale machinery and
+    # this runs once per (destination, date, photo) in the hot loops
+    year = f"{date.year:04d}"
+    year_month = f"{year}-{date.month:02d}"
+    day = f"{year_month}-{date.day:02d}"
+    folder_name = f"{day} {shoot_name}" if shoot_name else day
     return Path(base_path) / year / year_month / folder_name
   
 
+_FICLONE = 0x40049409  # Linux FICLONE ioctl; reflinks on btrfs/XFS
+
+_clonefile = None
+if platform.system() == "Darwin":
+    try:
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        pass
+
+
+def _clone_file(src, dst):
+    """Try to reflink src into dst (APFS clonefile / Linux FICLONE) -
+    instant and no data movement, but same-filesystem only. Returns
+    True on success; on False the caller runs a real copy."""
+    if _clonefile is not None:
+        return _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            stat = os.fstat(src_fd)
+        finally:
+            os.close(dst_fd)
+    except OSError:
+        return False
+    finally:
+        os.close(src_fd)
+    os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.chmod(dst, stat.st_mode)
+    return True
+
+
+def _fast_copy(src, dst):
+    """Copy src to dst preserving times and mode (like shutil.copy2),
+    keeping the data transfer in the kernel where the platform allows.
+    Both arguments are plain path strings."""
+    if hasattr(os, "copy_file_range"):  # Linux >= 4.5
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            stat = os.fstat(src_fd)
+            if hasattr(os, "posix_fadvise"):
+                # Sequential read of the whole file: crank up readahead
+                # and start it now
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            try:
+                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+                try:
+                    if stat.st_size:
+                        # Reserve the extents up front so the kernel can
+                        # lay the file out contiguously; one metadata op
+                        # instead of grow-on-write churn
+                        try:
+                            os.posix_fallocate(dst_fd, 0, stat.st_size)
+                        except OSError:
+                            pass  # not supported on this filesystem
+                    while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                        pass
+                finally:
+                    os.close(dst_fd)
+            except OSError:
+                # Unsupported filesystem pairing; let shutil pick its path
+                import shutil
+                shutil.copyfile(src, dst)
+            if hasattr(os, "posix_fadvise"):
+                # The card's pages won't be read again this session; drop
+                # them so a long import doesn't evict useful cache. The
+                # destination's pages are still dirty, so advising there
+                # would be a no-op without an fsync that costs more than
+                # it saves.
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(src_fd)
+    else:
+        # macOS: shutil.copyfile already goes through kernel fcopyfile
+        import shutil
+        stat = os.stat(src)
+        shutil.copyfile(src, dst)
+    os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.chmod(dst, stat.st_mode)
+
+
+def _copy_job(src, dst, try_clone):
+    """Copy one file, preferring a reflink when the caller says the two
+    paths share a filesystem."""
+    if try_clone and _clone_file(src, dst):
+        return
+    _fast_copy(src, dst)
+
+
 def copy_photos(grouped_photos, destinations, shoot_name, conflict_mode=None):
     """Copy photos to specified destinations, organized by date"""
     total_dests = len(destinations)
+
+    # With several destinations, only the first copy of each photo reads
+    # the source card; later destinations source from that first copy,
+    # recloned for free when they sit on the same device. Hardlinks are
+    # deliberately not used: a "second copy" sharing the inode is no
+    # backup at all.
+    dest_devs = {}
+    for dest in destinations:
+        try:
+            dest_devs[dest] = os.stat(dest).st_dev
+        except OSError:
+            dest_devs[dest] = None
+    primaries = {}
+
+    # Create every destination folder up front, parents before children,
+    # so each mkdir(parents=True) resolves on its first try instead of
+    # probing the whole chain per (destination, date) pair mid-copy
+    for folder in sorted({build_folder_path(dest, date, shoot_name)
+                          for dest in destinations for date in grouped_photos}):
+        folder.mkdir(parents=True, exist_ok=True)
+
     for dest_idx, dest in enumerate(destinations, 1):
         for date, photos in grouped_photos.items():
             folder = build_folder_path(dest, date, shoot_name)
-            folder.mkdir(parents=True, exist_ok=True)
+            # Join destinations as plain strings; the /-operator builds
+            # and normalizes a Path object per photo
+            folder_str = os.fspath(folder)
             total = len(photos)
-            for i, photo in enumerate(photos, 1):
-                dest_file = folder / photo.name
+
+            # Resolve conflicts up front on one thread (so rename
+            # counters can't race), then hand the copies to a pool.
+            # One listing of the folder stands in for per-file exists()
+            # probes; names claimed in this batch are added to the set.
+            # jobs is keyed by destination so two photos sharing a name
+            # (overwrite mode) collapse to one last-writer-wins copy
+            # instead of two threads writing the same inode.
+            jobs = {}
+            existing = _existing_names(folder)
+            for photo in photos:
+                name = photo.name
 
                 # Handle conflicts
-                if dest_file.exists():
+                if name in existing:
                     if conflict_mode == "s":
-                        print(f"Skipped: {photo.name} (already exists)")
+                        print(f"Skipped: {name} (already exists)")
                         continue
                     elif conflict_mode == "r":
                         counter = 2
-                        stem = dest_file.stem
-                        suffix = dest_file.suffix
-                        while dest_file.exists():
-                            dest_file = folder / f"{stem} ({counter}){suffix}"
+                        stem, dot, ext = name.rpartition('.')
+                        while name in existing:
+                            name = f"{stem} ({counter}){dot}{ext}"
                             counter += 1
 
-                shutil.copy2(photo, dest_file)
+                existing.add(name)
+                dest_file = os.path.join(folder_str, name)
+                primary = primaries.get((date, photo.path))
+                if primary is None:
+                    primaries[(date, photo.path)] = (dest_file, dest_devs[dest])
+                    jobs[dest_file] = (photo.path, False)
+                else:
+                    primary_file, primary_dev = primary
+                    same_dev = primary_dev is not None and primary_dev == dest_devs[dest]
+                    jobs[dest_file] = (primary_file, same_dev)
+
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                futures = [executor.submit(_copy_job, src, dst, clone)
+                           for dst, (src, clone) in jobs.items()]
+                # Throttled progress: a TTY write per file would contend
+                # with the copies themselves on fast batches
                 if total_dests > 1:
-                    print(f"Copying into folder {dest_idx}/{total_dests}, image {i}/{total} into {folder}    ", end="\r")
+                    progress_prefix = f"\rCopying into folder {dest_idx}/{total_dests}, image "
                 else:
-                    print(f"Copying image {i}/{total} into {folder}    ", end="\r")
+                    progress_prefix = "\rCopying image "
+                progress_suffix = f"/{total} into {folder}    "
+                last_update = 0.0
+                for i, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    now = time.monotonic()
+                    if now - last_update > 0.1 or i == len(futures):
+                        last_update = now
+                        sys.stdout.write(f"{progress_prefix}{i}{progress_suffix}")
+                        sys.stdout.flush()
             print()
 
 
 
 #main
-print("Scanning for SD card...")
-sd_card = find_sd_card()
-
-if sd_card:
-    print(f"Found SD card: {sd_card.parent.name}")
-    photos = find_photos(sd_card)
-    print(f"Found {len(photos)} photos")
-else:
-    print("No SD card found.")
-    choice = input("Select files manually? (y/n): ").strip().lower()
-    if choice in ["y", "yes"]:
-        print("Opening file picker...")
-        photos = select_source_files()
-        if photos:
-            print(f"Selected {len(photos)} photos")
+def main():
+    print("Scanning for SD card...")
+    sd_card = find_sd_card()
+
+    if sd_card:
+        print(f"Found SD card: {sd_card.parent.name}")
+        photos = find_photos(sd_card)
+        print(f"Found {len(photos)} photos")
+    else:
+        print("No SD card found.")
+        choice = input("Select files manually? (y/n): ").strip().lower()
+        if choice in ["y", "yes"]:
+            print("Opening file picker...")
+            photos = select_source_files()
+            if photos:
+                print(f"Selected {len(photos)} photos")
+            else:
+                print("No files selected.")
+                photos = []
         else:
-            print("No files selected.")
             photos = []
-    else:
-        photos = []
-
-if photos:
-    grouped = group_photos_by_date(photos)
-    print(f"Photos span {len(grouped)} dates")
-    destinations = get_destinations()
-    shoot_name = get_shoot_name()
-    if confirm_copy(grouped, destinations, shoot_name):
-        conflicts = check_conflicts(grouped, destinations, shoot_name)
-        conflict_mode = None
-        if conflicts:
-            print(f"\nFound {len(conflicts)} existing files.")
-            conflict_mode = handle_conflicts()
-        copy_photos(grouped, destinations, shoot_name, conflict_mode)
-        print("\nCopy Complete! Close and Re-open program to run again.")
-    else:
-        print("\nCopy cancelled.")
\ No newline at end of file
+
+    if photos:
+        grouped = group_photos_by_date(photos)
+        print(f"Photos span {len(grouped)} dates")
+        destinations = get_destinations()
+        shoot_name = get_shoot_name()
+        if confirm_copy(grouped, destinations, shoot_name):
+            conflicts = check_conflicts(grouped, destinations, shoot_name)
+            conflict_mode = None
+            if conflicts:
+                print(f"\nFound {len(conflicts)} existing files.")
+                conflict_mode = handle_conflicts()
+            copy_photos(grouped, destinations, shoot_name, conflict_mode)
+            print("\nCopy Complete! Close and Re-open program to run again.")
+        else:
+            print("\nCopy cancelled.")
+
+
+if __name__ == "__main__":
+    main()